@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AccessConfig(AppConfig):
     name = "kitsune.access"
     default_auto_field = "django.db.models.AutoField"
+
+    def ready(self):
+        from kitsune.access import signals  # noqa
@@ -1,12 +1,33 @@
 from functools import wraps
 
 from django.contrib.auth import REDIRECT_FIELD_NAME
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.http import HttpResponseForbidden, HttpResponseRedirect
+from django.urls import get_script_prefix, get_urlconf
+from django.utils.translation import get_language
 
 from urllib.parse import quote
 
 from kitsune.sumo.urlresolvers import reverse
 
+# Login URLs keyed by everything reverse() depends on for the current request.
+_login_urls = {}
+
+
+def _login_url():
+    """Returns reverse("users.login"), cached per locale."""
+    key = (get_language(), get_urlconf(), get_script_prefix())
+    url = _login_urls.get(key)
+    if url is None:
+        url = _login_urls[key] = reverse("users.login")
+    return url
+
+
+@receiver(setting_changed, dispatch_uid="access.decorators.clear_login_urls")
+def _clear_login_urls(**kwargs):
+    _login_urls.clear()
+
 
 def user_access_decorator(
     redirect_func, redirect_url_func, deny_func=None, redirect_field=REDIRECT_FIELD_NAME
@@ -23,23 +44,31 @@ def user_access_decorator(
 
     """
 
+    # Redirect back here afterwards? This is known up front, so pick the
+    # function that builds the final URL once instead of on every request.
+    if redirect_field:
+
+        def with_redirect_field(redirect_url, request):
+            return f"{redirect_url}?{redirect_field}={quote(request.get_full_path())}"
+
+    else:
+
+        def with_redirect_field(redirect_url, request):
+            return redirect_url
+
     def decorator(view_fn):
         def _wrapped_view(request, *args, **kwargs):
-            redirect = redirect_func(request.user)
-            if redirect and not request.headers.get("x-requested-with") == "XMLHttpRequest":
+            if redirect_func(request.user):
+                # Ajax requests can't follow the redirect, so deny them instead.
+                if request.headers.get("x-requested-with") == "XMLHttpRequest":
+                    return HttpResponseForbidden()
+
                 # We must call reverse at the view level, else the threadlocal
                 # locale prefixing doesn't take effect.
-                redirect_url = redirect_url_func() or reverse("users.login")
-
-                # Redirect back here afterwards?
-                if redirect_field:
-                    path = quote(request.get_full_path())
-                    redirect_url = "%s?%s=%s" % (redirect_url, redirect_field, path)
+                redirect_url = redirect_url_func() or _login_url()
+                return HttpResponseRedirect(with_redirect_field(redirect_url, request))
 
-                return HttpResponseRedirect(redirect_url)
-            elif (redirect and (request.headers.get("x-requested-with") == "XMLHttpRequest")) or (
-                deny_func and deny_func(request.user)
-            ):
+            if deny_func and deny_func(request.user):
                 return HttpResponseForbidden()
 
             return view_fn(request, *args, **kwargs)
@@ -65,18 +94,17 @@ def logout_required(redirect):
         )
 
 
-def login_required(func, login_url=None, redirect=REDIRECT_FIELD_NAME, only_active=True):
-    """Requires that the user is logged in."""
-    if only_active:
+def _is_anonymous(user):
+    return not user.is_authenticated
 
-        def redirect_func(user):
-            return not (user.is_authenticated and user.is_active)
 
-    else:
+def _is_anonymous_or_inactive(user):
+    return not (user.is_authenticated and user.is_active)
 
-        def redirect_func(user):
-            return not user.is_authenticated
 
+def login_required(func, login_url=None, redirect=REDIRECT_FIELD_NAME, only_active=True):
+    """Requires that the user is logged in."""
+    redirect_func = _is_anonymous_or_inactive if only_active else _is_anonymous
     return user_access_decorator(
         redirect_func, redirect_field=redirect, redirect_url_func=lambda: login_url
     )(func)
@@ -96,7 +124,7 @@ def permission_required(perm, login_url=None, redirect=REDIRECT_FIELD_NAME, only
             return not user.has_perm(perm)
 
     return user_access_decorator(
-        lambda u: not u.is_authenticated,
+        _is_anonymous,
         redirect_field=redirect,
         redirect_url_func=lambda: login_url,
         deny_func=deny_func,
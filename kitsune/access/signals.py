@@ -0,0 +1,19 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import m2m_changed
+from django.dispatch import receiver
+
+from kitsune.access.utils import clear_group_cache, clear_group_cache_for_users
+
+
+@receiver(
+    m2m_changed, sender=User.groups.through, dispatch_uid="access.signals.on_user_groups_changed"
+)
+def on_user_groups_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        # Changed through group.user_set, so the instance is the group. A clear
+        # doesn't report which users were removed, so it clears every user.
+        clear_group_cache_for_users(pk_set)
+    else:
+        clear_group_cache(instance)
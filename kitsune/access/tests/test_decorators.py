@@ -1,6 +1,7 @@
 from django.contrib.auth.models import AnonymousUser
 from django.http import HttpResponse
 from django.test.client import RequestFactory
+from django.utils import translation
 
 from kitsune.access.decorators import login_required, logout_required, permission_required
 from kitsune.sumo.tests import TestCase
@@ -85,6 +86,17 @@ class LoginRequiredTestCase(TestCase):
         response = view(request)
         self.assertEqual(403, response.status_code)
 
+    def test_login_url_per_locale(self):
+        """The cached login URL follows the active locale."""
+        view = login_required(simple_view)
+        for locale in ("en-US", "de", "en-US"):
+            request = RequestFactory().get("/foo")
+            request.user = AnonymousUser()
+            with translation.override(locale):
+                response = view(request)
+            self.assertEqual(302, response.status_code)
+            assert response["location"].startswith(f"/{locale}/")
+
 
 class PermissionRequiredTestCase(TestCase):
     def test_logged_out_default(self):
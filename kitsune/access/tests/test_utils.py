@@ -1,6 +1,7 @@
+from django.utils.functional import SimpleLazyObject
 from guardian.shortcuts import assign_perm
 
-from kitsune.access.utils import has_perm
+from kitsune.access.utils import get_group_ids, get_group_names, has_perm, in_group
 from kitsune.forums.tests import ForumFactory
 from kitsune.sumo.tests import TestCase
 from kitsune.users.tests import UserFactory, GroupFactory
@@ -91,3 +92,77 @@ class HasPermTests(TestCase):
         # User2 should only have access to the second restricted forum.
         self.assertFalse(has_perm(user2, "forums.view_in_forum", f1))
         self.assertTrue(has_perm(user2, "forums.view_in_forum", f2))
+
+
+class GroupCacheTests(TestCase):
+    def test_group_names_cached(self):
+        """Group names are only queried once per user instance."""
+        group = GroupFactory(name="cached")
+        user = UserFactory(groups=[group])
+
+        with self.assertNumQueries(1):
+            self.assertEqual(frozenset(["cached"]), get_group_names(user))
+            self.assertTrue(in_group(user, "cached"))
+            self.assertFalse(in_group(user, "other"))
+
+    def test_group_ids_cached(self):
+        """Group ids are materialized once per user instance."""
+        group = GroupFactory()
+        user = UserFactory(groups=[group])
+
+        with self.assertNumQueries(1):
+            self.assertEqual([group.id], get_group_ids(user))
+            self.assertEqual([group.id], get_group_ids(user))
+
+    def test_group_names_and_ids_share_query(self):
+        """Group names and ids are read from the same prefetched groups."""
+        group = GroupFactory(name="shared")
+        user = UserFactory(groups=[group])
+
+        with self.assertNumQueries(1):
+            self.assertEqual(frozenset(["shared"]), get_group_names(user))
+            self.assertEqual([group.id], get_group_ids(user))
+
+    def test_group_cache_cleared_on_change(self):
+        """Adding or removing a group invalidates the cached names."""
+        group = GroupFactory(name="changed")
+        user = UserFactory()
+
+        self.assertFalse(in_group(user, "changed"))
+        user.groups.add(group)
+        self.assertTrue(in_group(user, "changed"))
+        user.groups.remove(group)
+        self.assertFalse(in_group(user, "changed"))
+
+    def test_group_cache_cleared_on_reverse_change(self):
+        """Changing membership from the group side invalidates the cached names."""
+        group = GroupFactory(name="changed")
+        user = UserFactory()
+
+        self.assertFalse(in_group(user, "changed"))
+        group.user_set.add(user)
+        self.assertTrue(in_group(user, "changed"))
+        self.assertEqual([group.id], get_group_ids(user))
+        group.user_set.remove(user)
+        self.assertFalse(in_group(user, "changed"))
+        group.user_set.add(user)
+        self.assertTrue(in_group(user, "changed"))
+        group.user_set.clear()
+        self.assertFalse(in_group(user, "changed"))
+        self.assertEqual([], get_group_ids(user))
+
+    def test_group_cache_cleared_for_lazy_user(self):
+        """Group changes invalidate names cached through a lazy user like request.user."""
+        group = GroupFactory(name="changed")
+        user = UserFactory()
+        lazy_user = SimpleLazyObject(lambda: user)
+
+        self.assertFalse(in_group(lazy_user, "changed"))
+        group.user_set.add(user)
+        self.assertTrue(in_group(lazy_user, "changed"))
+        self.assertEqual([group.id], get_group_ids(lazy_user))
+        group.user_set.remove(user)
+        self.assertFalse(in_group(lazy_user, "changed"))
+        self.assertEqual([], get_group_ids(lazy_user))
+        lazy_user.groups.add(group)
+        self.assertTrue(in_group(lazy_user, "changed"))
@@ -1,5 +1,82 @@
+import weakref
+
+from django.db.models import prefetch_related_objects
+
+# User instances holding cached group data, so membership changes made from the
+# group side of the relation can find and clear them.
+_users_with_cached_groups = weakref.WeakValueDictionary()
+
+
 def has_perm(user, perm, obj):
     """
     Returns true if the user has the permission globally or on the given object.
     """
     return user.has_perm(perm) or user.has_perm(perm, obj)
+
+
+def _get_groups(user):
+    """
+    Returns the user's groups from the prefetch cache, prefetching them if
+    needed, so all the group helpers below share a single query.
+    """
+    if not user.is_authenticated:
+        return []
+    prefetched = getattr(user, "_prefetched_objects_cache", {})
+    if "groups" not in prefetched:
+        prefetch_related_objects([user], "groups")
+    return user.groups.all()
+
+
+def get_group_names(user):
+    """
+    Returns a frozenset with the names of the groups the user belongs to.
+
+    The result is cached on the user instance, so group checks made while
+    handling a single request only query the database once.
+    """
+    if not hasattr(user, "_cached_group_names"):
+        user._cached_group_names = frozenset(group.name for group in _get_groups(user))
+        _users_with_cached_groups[id(user)] = user
+    return user._cached_group_names
+
+
+def get_group_ids(user):
+    """
+    Returns a list with the ids of the groups the user belongs to.
+
+    Like get_group_names, the result is cached on the user instance.
+    """
+    if not hasattr(user, "_cached_group_ids"):
+        user._cached_group_ids = [group.id for group in _get_groups(user)]
+        _users_with_cached_groups[id(user)] = user
+    return user._cached_group_ids
+
+
+def in_group(user, *group_names):
+    """
+    Returns true if the user belongs to any of the given groups.
+    """
+    return not get_group_names(user).isdisjoint(group_names)
+
+
+def clear_group_cache(user):
+    """
+    Removes any group data cached on the user instance.
+    """
+    # Use delattr rather than popping from __dict__, so that lazy users like
+    # request.user forward the removal to the wrapped instance.
+    for attr in ("_cached_group_names", "_cached_group_ids"):
+        if hasattr(user, attr):
+            delattr(user, attr)
+    getattr(user, "_prefetched_objects_cache", {}).pop("groups", None)
+
+
+def clear_group_cache_for_users(user_ids=None):
+    """
+    Removes any group data cached on live instances of the given users, or of
+    all users if no ids are given.
+    """
+    for ref in _users_with_cached_groups.valuerefs():
+        user = ref()
+        if user is not None and (user_ids is None or user.pk in user_ids):
+            clear_group_cache(user)
@@ -6,14 +6,18 @@ from django.contrib.auth.models import Group, User
 from django.db import models
 from django.db.models import Q, QuerySet
 from django.db.models.functions import Now
-from django.db.models.signals import m2m_changed
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
 from kitsune.sumo.models import ModelBase
 from kitsune.sumo.templatetags.jinja_helpers import wiki_to_html
+from kitsune.sumo.utils import bump_cache_generation, get_cache_generation
 from kitsune.wiki.models import Locale
 
 
+ANNOUNCEMENTS_GENERATION_KEY = "announcements:generation"
+
+
 class Announcement(ModelBase):
     created = models.DateTimeField(default=datetime.now)
     creator = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -73,6 +77,14 @@ class Announcement(ModelBase):
         """Returns visible announcements for a given locale name."""
         return cls._visible_query(locale__locale=locale_name)
 
+    @classmethod
+    def cache_generation(cls):
+        """Returns a number that changes whenever announcements are modified.
+
+        It is meant to be part of any cache key holding announcements.
+        """
+        return get_cache_generation(ANNOUNCEMENTS_GENERATION_KEY)
+
     @classmethod
     def _visible_query(cls, **query_kwargs):
         """Return visible announcements given a groups query."""
@@ -96,3 +108,14 @@ def connector(sender, **kw):
                 send_group_email.delay(instance.pk)
             elif now < instance.show_after:
                 send_group_email.delay(instance.pk, eta=instance.show_after)
+
+
+@receiver(post_save, sender=Announcement, dispatch_uid="announcements.invalidate_cache.save")
+@receiver(post_delete, sender=Announcement, dispatch_uid="announcements.invalidate_cache.delete")
+@receiver(
+    m2m_changed,
+    sender=Announcement.groups.through,
+    dispatch_uid="announcements.invalidate_cache.m2m",
+)
+def invalidate_cache(sender, **kw):
+    bump_cache_generation(ANNOUNCEMENTS_GENERATION_KEY)
@@ -1,11 +1,26 @@
+from django.core.cache import cache
 from django_jinja import library
 
+from kitsune.access.utils import get_group_ids
 from kitsune.announcements.models import Announcement
 
+ANNOUNCEMENTS_CACHE_TIMEOUT = 60  # 1 minute
+
 
 @library.global_function
 def get_announcements(request):
     user = request.user if request.user.is_authenticated else None
     if user:
-        return Announcement.get_for_groups(user.groups.values_list("id", flat=True))
-    return Announcement.get_site_wide()
+        group_ids = sorted(get_group_ids(user))
+        key = "announcements:{}:groups:{}".format(
+            Announcement.cache_generation(), ",".join(map(str, group_ids))
+        )
+        return cache.get_or_set(
+            key,
+            lambda: list(Announcement.get_for_groups(group_ids)),
+            ANNOUNCEMENTS_CACHE_TIMEOUT,
+        )
+    key = "announcements:{}:site-wide".format(Announcement.cache_generation())
+    return cache.get_or_set(
+        key, lambda: list(Announcement.get_site_wide()), ANNOUNCEMENTS_CACHE_TIMEOUT
+    )
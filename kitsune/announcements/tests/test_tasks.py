@@ -12,6 +12,13 @@ from kitsune.users.tests import GroupFactory, UserFactory
 class AnnouncementSaveTests(TestCase):
     """Test creating group announcements."""
 
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(Site.objects, "get_current")
+        self.get_current = patcher.start()
+        self.get_current.return_value.domain = "testserver"
+        self.addCleanup(patcher.stop)
+
     def _setup_announcement(self, visible_dates=True, send_email=False):
         g = GroupFactory()
         u1 = UserFactory(groups=[g])
@@ -24,11 +31,8 @@ class AnnouncementSaveTests(TestCase):
         announcement.groups.add(g)
         return announcement
 
-    @mock.patch.object(Site.objects, "get_current")
-    def test_create_announcement(self, get_current):
+    def test_create_announcement(self):
         """An announcement is created and email is sent to group members."""
-        get_current.return_value.domain = "testserver"
-
         a = self._setup_announcement(send_email=True)
         # Signal fired, emails sent.
         self.assertEqual(2, len(mail.outbox))
@@ -40,18 +44,12 @@ class AnnouncementSaveTests(TestCase):
         a.save()
         self.assertEqual(2, len(mail.outbox))
 
-    @mock.patch.object(Site.objects, "get_current")
-    def test_create_invisible_announcement(self, get_current):
+    def test_create_invisible_announcement(self):
         """No emails sent if announcement is not visible."""
-        get_current.return_value.domain = "testserver"
-
         self._setup_announcement(visible_dates=False)
         self.assertEqual(0, len(mail.outbox))
 
-    @mock.patch.object(Site.objects, "get_current")
-    def test_send_nonexistent(self, get_current):
+    def test_send_nonexistent(self):
         """Send a non-existent announcement by email shouldn't break."""
-        get_current.return_value.domain = "testserver"
-
         send_group_email(1)
         self.assertEqual(0, len(mail.outbox))
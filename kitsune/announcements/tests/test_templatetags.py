@@ -0,0 +1,49 @@
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test.client import RequestFactory
+
+from kitsune.announcements.models import ANNOUNCEMENTS_GENERATION_KEY
+from kitsune.announcements.templatetags.jinja_helpers import get_announcements
+from kitsune.announcements.tests import AnnouncementFactory
+from kitsune.sumo.tests import TestCase
+from kitsune.users.tests import GroupFactory, UserFactory
+
+
+class GetAnnouncementsTests(TestCase):
+    def setUp(self):
+        self.request = RequestFactory().get("/")
+        self.request.user = AnonymousUser()
+
+    def test_site_wide_cached(self):
+        """Site-wide announcements are only queried once."""
+        a = AnnouncementFactory()
+        self.assertEqual([a], get_announcements(self.request))
+        with self.assertNumQueries(0):
+            self.assertEqual([a], get_announcements(self.request))
+
+    def test_cache_invalidated_on_save(self):
+        """Creating an announcement invalidates the cached results."""
+        self.assertEqual([], get_announcements(self.request))
+        a = AnnouncementFactory()
+        self.assertEqual([a], get_announcements(self.request))
+
+    def test_cache_invalidated_after_generation_evicted(self):
+        """Losing the generation key doesn't bring back stale cached results."""
+        self.assertEqual([], get_announcements(self.request))
+        a = AnnouncementFactory()
+        self.assertEqual([a], get_announcements(self.request))
+        cache.delete(ANNOUNCEMENTS_GENERATION_KEY)
+        # Reading reseeds the generation without reusing the earlier ones.
+        self.assertEqual([a], get_announcements(self.request))
+        b = AnnouncementFactory()
+        self.assertEqual({a, b}, set(get_announcements(self.request)))
+
+    def test_group_announcements(self):
+        """Authenticated users get the announcements for their groups."""
+        group = GroupFactory()
+        self.request.user = UserFactory(groups=[group])
+        AnnouncementFactory()
+        self.assertEqual([], get_announcements(self.request))
+        a = AnnouncementFactory()
+        a.groups.add(group)
+        self.assertEqual([a], get_announcements(self.request))
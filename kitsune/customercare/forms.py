@@ -4,7 +4,7 @@ from django.utils.translation import gettext_lazy as _lazy
 
 from kitsune.customercare.zendesk import ZendeskClient
 
-PRODUCTS_WITH_OS = ["firefox-private-network-vpn"]
+PRODUCTS_WITH_OS = frozenset(["firefox-private-network-vpn"])
 
 # See docs/zendesk.md for details about getting the valid choice values for each field:
 CATEGORY_CHOICES = [
@@ -59,14 +59,13 @@ class ZendeskForm(forms.Form):
     country = forms.CharField(widget=forms.HiddenInput, required=False)
 
     def __init__(self, *args, product, user=None, **kwargs):
-        kwargs.update({"initial": {"product": product.slug}})
+        kwargs.update({"initial": {"product": product.slug}, "label_suffix": ""})
         super().__init__(*args, **kwargs)
         if product.slug in settings.LOGIN_EXCEPTIONS and not user.is_authenticated:
             self.fields["email"].widget = forms.EmailInput()
             self.fields["category"].choices = CATEGORY_CHOICES_LOGINLESS
         else:
             self.fields["email"].initial = user.email
-        self.label_suffix = ""
         if product.slug not in PRODUCTS_WITH_OS:
             del self.fields["os"]
 
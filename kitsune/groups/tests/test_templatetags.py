@@ -20,7 +20,6 @@ class GroupHelperTests(TestCase):
 
     def test_group_link_with_profile(self):
         g = GroupFactory()
-        g.save()
         p = GroupProfile.objects.create(group=g, slug="foo")
         text = group_link(g)
         doc = pq(text)
@@ -30,10 +29,8 @@ class GroupHelperTests(TestCase):
     def test_right_group_profile(self):
         """Make sure we get the right group profile."""
         g1 = GroupFactory(pk=100)
-        g1.save()
         self.assertEqual(100, g1.pk)
         g2 = GroupFactory(pk=101)
-        g2.save()
         self.assertEqual(101, g2.pk)
         p = GroupProfileFactory(pk=100, group=g2, slug="foo")
         self.assertEqual(100, p.pk)
@@ -42,7 +39,6 @@ class GroupHelperTests(TestCase):
 
     def test_group_avatar(self):
         g = GroupFactory()
-        g.save()
         p = GroupProfile.objects.create(group=g, slug="foo")
         url = group_avatar(p)
         self.assertRegex(url, rf"{re.escape(settings.STATIC_URL)}avatar\.[0-9a-f]+\.png")
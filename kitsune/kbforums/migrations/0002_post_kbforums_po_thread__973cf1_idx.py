@@ -0,0 +1,16 @@
+# Generated by Django 4.2.11 on 2026-10-15 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("kbforums", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(fields=["thread", "created"], name="kbforums_po_thread__973cf1_idx"),
+        ),
+    ]
@@ -91,6 +91,7 @@ class Post(ModelBase):
 
     class Meta:
         ordering = ["created"]
+        indexes = [models.Index(fields=["thread", "created"])]
 
     def __str__(self):
         return self.content[:50]
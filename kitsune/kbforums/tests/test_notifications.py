@@ -1,8 +1,11 @@
 from unittest import mock
 
-from django.contrib.auth.models import User
+from django.contrib.auth import SESSION_KEY
 from django.contrib.sites.models import Site
 from django.core import mail
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
 
 from kitsune.kbforums.events import (
     NewPostEvent,
@@ -11,7 +14,7 @@ from kitsune.kbforums.events import (
     NewThreadInLocaleEvent,
 )
 from kitsune.kbforums.models import Post, Thread
-from kitsune.kbforums.tests import PostFactory, ThreadFactory
+from kitsune.kbforums.tests import ThreadFactory
 from kitsune.sumo.tests import TestCase, attrs_eq, post, starts_with
 from kitsune.users.models import Setting
 from kitsune.users.tests import GroupFactory, UserFactory
@@ -62,15 +65,56 @@ Unsubscribe from these emails:
 https://testserver/en-US/unsubscribe/"""
 
 
+def reply_email(author, post):
+    """Return the expected start of the email for the given reply."""
+    return REPLY_EMAIL % {
+        "user": author.profile.name,
+        "document_slug": post.thread.document.slug,
+        "thread_id": post.thread.id,
+        "post_id": post.id,
+    }
+
+
+def new_thread_email(author, thread):
+    """Return the expected start of the email for the given new thread."""
+    return NEW_THREAD_EMAIL % {
+        "user": author.profile.name,
+        "document_slug": thread.document.slug,
+        "thread_id": thread.id,
+    }
+
+
 class NotificationsTests(TestCase):
     """Test that notifications get sent."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.jsocol = UserFactory(username="jsocol")
+        cls.berkerpeksag = UserFactory(username="berkerpeksag")
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(Site.objects, "get_current")
+        patcher.start().return_value.domain = "testserver"
+        self.addCleanup(patcher.stop)
+
+    def _client_for(self, user):
+        """Return a separate client logged in as the given user."""
+        client = Client()
+        client.force_login(user, backend="django.contrib.auth.backends.ModelBackend")
+        return client
+
+    def _login(self, user):
+        """Log in as the given user without hashing its password, unless already logged in."""
+        if self.client.session.get(SESSION_KEY) != str(user.pk):
+            self.client.force_login(user, backend="django.contrib.auth.backends.ModelBackend")
+
     @mock.patch.object(NewPostEvent, "fire")
     def test_fire_on_reply(self, fire):
         """The event fires when there is a reply."""
         t = ThreadFactory()
         u = UserFactory()
-        self.client.login(username=u.username, password="testpass")
+        self._login(u)
         post(
             self.client, "wiki.discuss.reply", {"content": "a post"}, args=[t.document.slug, t.id]
         )
@@ -82,7 +126,7 @@ class NotificationsTests(TestCase):
         """The event fires when there is a new thread."""
         d = ApprovedRevisionFactory().document
         u = UserFactory()
-        self.client.login(username=u.username, password="testpass")
+        self._login(u)
         post(
             self.client,
             "wiki.discuss.new_thread",
@@ -92,10 +136,9 @@ class NotificationsTests(TestCase):
         # NewThreadEvent.fire() is called.
         assert fire.called
 
-    def _toggle_watch_thread_as(self, username, thread, turn_on=True):
+    def _toggle_watch_thread_as(self, user, thread, turn_on=True):
         """Watch a thread and return it."""
-        self.client.login(username=username, password="testpass")
-        user = User.objects.get(username=username)
+        self._login(user)
         watch = "yes" if turn_on else "no"
         post(
             self.client,
@@ -112,10 +155,9 @@ class NotificationsTests(TestCase):
             ), "NewPostEvent should not be notifying."
         return thread
 
-    def _toggle_watch_kbforum_as(self, username, document, turn_on=True):
+    def _toggle_watch_kbforum_as(self, user, document, turn_on=True):
         """Watch a discussion forum and return it."""
-        self.client.login(username=username, password="testpass")
-        user = User.objects.get(username=username)
+        self._login(user)
         watch = "yes" if turn_on else "no"
         post(self.client, "wiki.discuss.watch_forum", {"watch": watch}, args=[document.slug])
         # Watch exists or not, depending on watch.
@@ -129,46 +171,31 @@ class NotificationsTests(TestCase):
             ), "NewThreadEvent should not be notifying."
         return document
 
-    @mock.patch.object(Site.objects, "get_current")
-    def test_watch_thread_then_reply(self, get_current):
+    def test_watch_thread_then_reply(self):
         """The event fires and sends emails when watching a thread."""
-        get_current.return_value.domain = "testserver"
-        u = UserFactory(username="jsocol")
-        u_b = UserFactory(username="berkerpeksag")
+        u = self.jsocol
+        u_b = self.berkerpeksag
         d = DocumentFactory(title="an article title")
         _t = ThreadFactory(title="Sticky Thread", document=d, is_sticky=True)
-        t = self._toggle_watch_thread_as(u_b.username, _t, turn_on=True)
-        self.client.login(username=u.username, password="testpass")
-        post(
-            self.client, "wiki.discuss.reply", {"content": "a post"}, args=[t.document.slug, t.id]
-        )
+        t = self._toggle_watch_thread_as(u_b, _t, turn_on=True)
+        client = self._client_for(u)
+        post(client, "wiki.discuss.reply", {"content": "a post"}, args=[t.document.slug, t.id])
 
-        p = Post.objects.all().order_by("-id")[0]
+        p = Post.objects.filter(thread=t).latest("id")
         attrs_eq(mail.outbox[0], to=[u_b.email], subject="Re: an article title - Sticky Thread")
-        starts_with(
-            mail.outbox[0].body,
-            REPLY_EMAIL
-            % {
-                "user": u.profile.name,
-                "document_slug": d.slug,
-                "thread_id": t.id,
-                "post_id": p.id,
-            },
-        )
-
-        self._toggle_watch_thread_as(u_b.username, _t, turn_on=False)
+        starts_with(mail.outbox[0].body, reply_email(u, p))
 
     def test_watch_other_thread_then_reply(self):
         """Watching a different thread than the one we're replying to shouldn't
         notify."""
-        u_b = UserFactory(username="berkerpeksag")
+        u_b = self.berkerpeksag
         _t = ThreadFactory()
-        self._toggle_watch_thread_as(u_b.username, _t, turn_on=True)
+        self._toggle_watch_thread_as(u_b, _t, turn_on=True)
         u = UserFactory()
         t2 = ThreadFactory()
-        self.client.login(username=u.username, password="testpass")
+        client = self._client_for(u)
         post(
-            self.client,
+            client,
             "wiki.discuss.reply",
             {"content": "a post"},
             args=[t2.document.slug, t2.id],
@@ -176,47 +203,31 @@ class NotificationsTests(TestCase):
 
         assert not mail.outbox
 
-    @mock.patch.object(Site.objects, "get_current")
-    def test_watch_forum_then_new_thread(self, get_current):
+    def test_watch_forum_then_new_thread(self):
         """Watching a forum and creating a new thread should send email."""
-        get_current.return_value.domain = "testserver"
-
         u = UserFactory()
         d = ApprovedRevisionFactory(document__title="an article title").document
-        f = self._toggle_watch_kbforum_as(u.username, d, turn_on=True)
-        u2 = UserFactory(username="jsocol")
-        self.client.login(username=u2.username, password="testpass")
+        f = self._toggle_watch_kbforum_as(u, d, turn_on=True)
+        u2 = self.jsocol
+        client = self._client_for(u2)
         post(
-            self.client,
+            client,
             "wiki.discuss.new_thread",
             {"title": "a title", "content": "a post"},
             args=[f.slug],
         )
 
-        t = Thread.objects.all().order_by("-id")[0]
+        t = Thread.objects.filter(document=d).latest("id")
         attrs_eq(mail.outbox[0], to=[u.email], subject="an article title - a title")
-        starts_with(
-            mail.outbox[0].body,
-            NEW_THREAD_EMAIL
-            % {
-                "user": u2.profile.name,
-                "document_slug": d.slug,
-                "thread_id": t.id,
-            },
-        )
+        starts_with(mail.outbox[0].body, new_thread_email(u2, t))
 
-        self._toggle_watch_kbforum_as(u.username, d, turn_on=False)
-
-    @mock.patch.object(Site.objects, "get_current")
-    def test_watch_forum_then_new_thread_as_self(self, get_current):
+    def test_watch_forum_then_new_thread_as_self(self):
         """Watching a forum and creating a new thread as myself should not
         send email."""
-        get_current.return_value.domain = "testserver"
-
         u = UserFactory()
         d = ApprovedRevisionFactory().document
-        f = self._toggle_watch_kbforum_as(u.username, d, turn_on=True)
-        self.client.login(username=u.username, password="testpass")
+        f = self._toggle_watch_kbforum_as(u, d, turn_on=True)
+        self._login(u)
         post(
             self.client,
             "wiki.discuss.new_thread",
@@ -226,156 +237,99 @@ class NotificationsTests(TestCase):
         # Assert no email is sent.
         assert not mail.outbox
 
-    @mock.patch.object(Site.objects, "get_current")
-    def test_watch_forum_then_new_post(self, get_current):
+    def test_watch_forum_then_new_post(self):
         """Watching a forum and replying to a thread should send email."""
-        get_current.return_value.domain = "testserver"
-
         u = UserFactory()
         d = ApprovedRevisionFactory(document__title="an article title").document
-        f = self._toggle_watch_kbforum_as(u.username, d, turn_on=True)
+        f = self._toggle_watch_kbforum_as(u, d, turn_on=True)
         t = ThreadFactory(title="Sticky Thread", document=d)
-        u2 = UserFactory(username="jsocol")
-        self.client.login(username=u2.username, password="testpass")
-        post(self.client, "wiki.discuss.reply", {"content": "a post"}, args=[f.slug, t.id])
+        u2 = self.jsocol
+        client = self._client_for(u2)
+        post(client, "wiki.discuss.reply", {"content": "a post"}, args=[f.slug, t.id])
 
-        p = Post.objects.all().order_by("-id")[0]
+        p = Post.objects.filter(thread=t).latest("id")
         attrs_eq(mail.outbox[0], to=[u.email], subject="Re: an article title - Sticky Thread")
-        starts_with(
-            mail.outbox[0].body,
-            REPLY_EMAIL
-            % {
-                "user": u2.profile.name,
-                "document_slug": d.slug,
-                "thread_id": t.id,
-                "post_id": p.id,
-            },
-        )
+        starts_with(mail.outbox[0].body, reply_email(u2, p))
 
-    @mock.patch.object(Site.objects, "get_current")
-    def test_watch_forum_then_new_post_as_self(self, get_current):
+    def test_watch_forum_then_new_post_as_self(self):
         """Watching a forum and replying as myself should not send email."""
-        get_current.return_value.domain = "testserver"
-
         u = UserFactory()
         d = ApprovedRevisionFactory(document__title="an article title").document
-        f = self._toggle_watch_kbforum_as(u.username, d, turn_on=True)
+        f = self._toggle_watch_kbforum_as(u, d, turn_on=True)
         t = ThreadFactory(document=d)
-        self.client.login(username=u.username, password="testpass")
+        self._login(u)
         post(self.client, "wiki.discuss.reply", {"content": "a post"}, args=[f.slug, t.id])
         # Assert no email is sent.
         assert not mail.outbox
 
-    @mock.patch.object(Site.objects, "get_current")
-    def test_watch_both_then_new_post(self, get_current):
+    def test_watch_both_then_new_post(self):
         """Watching both and replying to a thread should send ONE email."""
-        get_current.return_value.domain = "testserver"
-
         u = UserFactory()
         d = ApprovedRevisionFactory(document__title="an article title").document
-        f = self._toggle_watch_kbforum_as(u.username, d, turn_on=True)
+        f = self._toggle_watch_kbforum_as(u, d, turn_on=True)
         t = ThreadFactory(title="Sticky Thread", document=d)
-        self._toggle_watch_thread_as(u.username, t, turn_on=True)
-        u2 = UserFactory(username="jsocol")
-        self.client.login(username=u2.username, password="testpass")
-        post(self.client, "wiki.discuss.reply", {"content": "a post"}, args=[f.slug, t.id])
+        self._toggle_watch_thread_as(u, t, turn_on=True)
+        u2 = self.jsocol
+        client = self._client_for(u2)
+        post(client, "wiki.discuss.reply", {"content": "a post"}, args=[f.slug, t.id])
 
         self.assertEqual(1, len(mail.outbox))
-        p = Post.objects.all().order_by("-id")[0]
+        p = Post.objects.filter(thread=t).latest("id")
         attrs_eq(mail.outbox[0], to=[u.email], subject="Re: an article title - Sticky Thread")
-        starts_with(
-            mail.outbox[0].body,
-            REPLY_EMAIL
-            % {
-                "user": u2.profile.name,
-                "document_slug": d.slug,
-                "thread_id": t.id,
-                "post_id": p.id,
-            },
-        )
+        starts_with(mail.outbox[0].body, reply_email(u2, p))
 
-        self._toggle_watch_kbforum_as(u.username, d, turn_on=False)
-        self._toggle_watch_thread_as(u.username, t, turn_on=False)
-
-    @mock.patch.object(Site.objects, "get_current")
-    def test_watch_locale_then_new_post(self, get_current):
+    def test_watch_locale_then_new_post(self):
         """Watching locale and reply to a thread."""
-        get_current.return_value.domain = "testserver"
-
         d = DocumentFactory(title="an article title", locale="en-US")
         t = ThreadFactory(document=d, title="Sticky Thread")
         u = UserFactory()
-        self.client.login(username=u.username, password="testpass")
+        self._login(u)
         post(self.client, "wiki.discuss.watch_locale", {"watch": "yes"})
 
         # Reply as jsocol to document d.
-        u2 = UserFactory(username="jsocol")
-        self.client.login(username=u2.username, password="testpass")
-        post(self.client, "wiki.discuss.reply", {"content": "a post"}, args=[d.slug, t.id])
+        u2 = self.jsocol
+        client = self._client_for(u2)
+        post(client, "wiki.discuss.reply", {"content": "a post"}, args=[d.slug, t.id])
 
         # Email was sent as expected.
         self.assertEqual(1, len(mail.outbox))
-        p = Post.objects.all().order_by("-id")[0]
+        p = Post.objects.filter(thread=t).latest("id")
         attrs_eq(mail.outbox[0], to=[u.email], subject="Re: an article title - Sticky Thread")
-        starts_with(
-            mail.outbox[0].body,
-            REPLY_EMAIL
-            % {
-                "user": u2.profile.name,
-                "document_slug": d.slug,
-                "thread_id": t.id,
-                "post_id": p.id,
-            },
-        )
+        starts_with(mail.outbox[0].body, reply_email(u2, p))
 
-    @mock.patch.object(Site.objects, "get_current")
-    def test_watch_all_then_new_post(self, get_current):
+    def test_watch_all_then_new_post(self):
         """Watching document + thread + locale and reply to thread."""
-        get_current.return_value.domain = "testserver"
-
         u = UserFactory()
         _d = ApprovedRevisionFactory(document__title="an article title").document
-        d = self._toggle_watch_kbforum_as(u.username, _d, turn_on=True)
+        d = self._toggle_watch_kbforum_as(u, _d, turn_on=True)
         t = ThreadFactory(title="Sticky Thread", document=d)
-        self._toggle_watch_thread_as(u.username, t, turn_on=True)
-        self.client.login(username=u.username, password="testpass")
+        self._toggle_watch_thread_as(u, t, turn_on=True)
+        self._login(u)
         post(self.client, "wiki.discuss.watch_locale", {"watch": "yes"})
 
         # Reply as jsocol to document d.
-        u2 = UserFactory(username="jsocol")
-        self.client.login(username=u2.username, password="testpass")
-        post(self.client, "wiki.discuss.reply", {"content": "a post"}, args=[d.slug, t.id])
+        u2 = self.jsocol
+        client = self._client_for(u2)
+        post(client, "wiki.discuss.reply", {"content": "a post"}, args=[d.slug, t.id])
 
         # Only ONE email was sent. As expected.
         self.assertEqual(1, len(mail.outbox))
-        p = Post.objects.all().order_by("-id")[0]
+        p = Post.objects.filter(thread=t).latest("id")
         attrs_eq(mail.outbox[0], to=[u.email], subject="Re: an article title - Sticky Thread")
-        starts_with(
-            mail.outbox[0].body,
-            REPLY_EMAIL
-            % {
-                "user": u2.profile.name,
-                "document_slug": d.slug,
-                "thread_id": t.id,
-                "post_id": p.id,
-            },
-        )
+        starts_with(mail.outbox[0].body, reply_email(u2, p))
 
-    @mock.patch.object(Site.objects, "get_current")
-    def test_watch_other_locale_then_new_thread(self, get_current):
+    def test_watch_other_locale_then_new_thread(self):
         """Watching a different locale and createing a thread does not
         notify."""
-        get_current.return_value.domain = "testserver"
-
         d = ApprovedRevisionFactory(document__locale="en-US").document
-        u = UserFactory(username="berkerpeksag")
-        self.client.login(username=u.username, password="testpass")
+        u = self.berkerpeksag
+        self._login(u)
         post(self.client, "wiki.discuss.watch_locale", {"watch": "yes"}, locale="ja")
 
         u2 = UserFactory()
-        self.client.login(username=u2.username, password="testpass")
+        client = self._client_for(u2)
         post(
-            self.client,
+            client,
             "wiki.discuss.new_thread",
             {"title": "a title", "content": "a post"},
             args=[d.slug],
@@ -384,48 +338,34 @@ class NotificationsTests(TestCase):
         # Email was not sent.
         self.assertEqual(0, len(mail.outbox))
 
-    @mock.patch.object(Site.objects, "get_current")
-    def test_watch_locale_then_new_thread(self, get_current):
+    def test_watch_locale_then_new_thread(self):
         """Watching locale and create a thread."""
-        get_current.return_value.domain = "testserver"
-
         d = ApprovedRevisionFactory(
             document__title="an article title", document__locale="en-US"
         ).document
-        u = UserFactory(username="berkerpeksag")
-        self.client.login(username=u.username, password="testpass")
+        u = self.berkerpeksag
+        self._login(u)
         post(self.client, "wiki.discuss.watch_locale", {"watch": "yes"})
 
-        u2 = UserFactory(username="jsocol")
-        self.client.login(username=u2.username, password="testpass")
+        u2 = self.jsocol
+        client = self._client_for(u2)
         post(
-            self.client,
+            client,
             "wiki.discuss.new_thread",
             {"title": "a title", "content": "a post"},
             args=[d.slug],
         )
 
         # Email was sent as expected.
-        t = Thread.objects.all().order_by("-id")[0]
+        t = Thread.objects.filter(document=d).latest("id")
         attrs_eq(mail.outbox[0], to=[u.email], subject="an article title - a title")
-        starts_with(
-            mail.outbox[0].body,
-            NEW_THREAD_EMAIL
-            % {
-                "user": u2.profile.name,
-                "document_slug": d.slug,
-                "thread_id": t.id,
-            },
-        )
+        starts_with(mail.outbox[0].body, new_thread_email(u2, t))
 
-    @mock.patch.object(Site.objects, "get_current")
-    def test_autowatch_new_thread(self, get_current):
+    def test_autowatch_new_thread(self):
         """Creating a new thread should email responses"""
-        get_current.return_value.domain = "testserver"
-
         d = ApprovedRevisionFactory().document
         u = UserFactory()
-        self.client.login(username=u.username, password="testpass")
+        self._login(u)
         s = Setting.objects.create(user=u, name="kbforums_watch_new_thread", value="False")
         data = {"title": "a title", "content": "a post"}
         post(self.client, "wiki.discuss.new_thread", data, args=[d.slug])
@@ -436,20 +376,17 @@ class NotificationsTests(TestCase):
         s.value = "True"
         s.save()
         post(self.client, "wiki.discuss.new_thread", data, args=[d.slug])
-        t2 = Thread.objects.all().order_by("-id")[0]
+        t2 = Thread.objects.filter(document=d).latest("id")
         assert NewPostEvent.is_notifying(u, t2), "NewPostEvent should be notifying"
 
-    @mock.patch.object(Site.objects, "get_current")
-    def test_autowatch_reply(self, get_current):
-        get_current.return_value.domain = "testserver"
-
+    def test_autowatch_reply(self):
         u = UserFactory()
         t1 = ThreadFactory(is_locked=False)
         t2 = ThreadFactory(is_locked=False)
         assert not NewPostEvent.is_notifying(u, t1)
         assert not NewPostEvent.is_notifying(u, t2)
 
-        self.client.login(username=u.username, password="testpass")
+        self._login(u)
         s = Setting.objects.create(user=u, name="kbforums_watch_after_reply", value="True")
         data = {"content": "some content"}
         post(self.client, "wiki.discuss.reply", data, args=[t1.document.slug, t1.pk])
@@ -464,122 +401,80 @@ class NotificationsTests(TestCase):
 class RestrictedVisibilityTests(TestCase):
     """Test that notifications respect a document's restricted visibility."""
 
-    def setUp(self):
-        super().setUp()
-        self.group = GroupFactory()
-        self.user1 = UserFactory(email="user1@example.com")
-        self.user2 = UserFactory(email="user2@example.com", groups=[self.group])
-
-    def test_post_event(self):
-        """
-        Test that post events on restricted documents will only notify
-        unrestricted users.
-        """
-        doc = DocumentFactory()
-        thread = ThreadFactory(document=doc)
-        NewPostEvent.notify(self.user1, thread)
-        NewPostEvent.notify(self.user2, thread)
-
-        self.assertEqual(len(mail.outbox), 0)
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = GroupFactory()
+        cls.user1 = UserFactory(email="user1@example.com")
+        cls.user2 = UserFactory(email="user2@example.com", groups=[cls.group])
+        cls.creator = UserFactory()
 
-        post1 = PostFactory(thread=thread)
-        NewPostEvent(post1).fire(exclude=[post1.creator])
-        self.assertEqual(len(mail.outbox), 2)
-        self.assertEqual(
-            set((mail.outbox[0].to[0], mail.outbox[1].to[0])),
-            set((self.user1.email, self.user2.email)),
-        )
+    def _assert_mail_to(self, *emails):
+        """Assert that exactly one mail was sent to each of the given emails."""
+        self.assertEqual(sorted(to for m in mail.outbox for to in m.to), sorted(emails))
 
-        doc.restrict_to_groups.add(self.group)
-
-        mail.outbox = []
-        post2 = PostFactory(thread=thread)
-        NewPostEvent(post2).fire(exclude=[post1.creator, post2.creator])
-        self.assertEqual(len(mail.outbox), 1)
-        self.assertIn(self.user2.email, mail.outbox[0].to)
-
-    def test_thread_event(self):
+    def test_events(self):
         """
-        Test that thread events on restricted documents will only notify
-        unrestricted users.
+        Test that events on restricted documents will only notify unrestricted users.
         """
-        doc = DocumentFactory()
-        NewThreadEvent.notify(self.user1, doc)
-        NewThreadEvent.notify(self.user2, doc)
-
-        self.assertEqual(len(mail.outbox), 0)
-
-        thread1 = ThreadFactory(document=doc)
-        post1 = PostFactory(thread=thread1)
-        NewThreadEvent(post1).fire(exclude=[post1.creator])
-        self.assertEqual(len(mail.outbox), 2)
-        self.assertEqual(
-            set((mail.outbox[0].to[0], mail.outbox[1].to[0])),
-            set((self.user1.email, self.user2.email)),
-        )
-
-        doc.restrict_to_groups.add(self.group)
-
-        mail.outbox = []
-        thread2 = ThreadFactory(document=doc)
-        post2 = PostFactory(thread=thread2)
-        NewThreadEvent(post2).fire(exclude=[post1.creator, post2.creator])
-        self.assertEqual(len(mail.outbox), 1)
-        self.assertIn(self.user2.email, mail.outbox[0].to)
-
-    def test_post_in_locale_event(self):
+        for event_cls, get_watch_kwargs in (
+            (NewPostEvent, lambda doc, thread: {"instance": thread}),
+            (NewThreadEvent, lambda doc, thread: {"instance": doc}),
+            (NewPostInLocaleEvent, lambda doc, thread: {"locale": doc.locale}),
+            (NewThreadInLocaleEvent, lambda doc, thread: {"locale": doc.locale}),
+        ):
+            with self.subTest(event=event_cls.__name__):
+                # Each event gets its own document, since it becomes restricted.
+                doc = DocumentFactory()
+                thread = ThreadFactory(document=doc)
+                watch_kwargs = get_watch_kwargs(doc, thread)
+                event_cls.notify(self.user1, **watch_kwargs)
+                event_cls.notify(self.user2, **watch_kwargs)
+
+                # The events only need saved posts, not the thread bookkeeping
+                # done by Post.save(), so create both posts in a single query.
+                post1, post2 = Post.objects.bulk_create(
+                    [
+                        Post(thread=thread, creator=self.creator, content="a post"),
+                        Post(thread=thread, creator=self.creator, content="another post"),
+                    ]
+                )
+
+                mail.outbox.clear()
+                event_cls(post1).fire(exclude=[self.creator])
+                self._assert_mail_to(self.user1.email, self.user2.email)
+
+                doc.restrict_to_groups.add(self.group)
+
+                mail.outbox.clear()
+                event_cls(post2).fire(exclude=[self.creator])
+                self._assert_mail_to(self.user2.email)
+
+    def test_restricted_event_queries(self):
         """
-        Test that NewPostInLocaleEvent events on restricted documents will only notify
-        unrestricted users.
+        The number of queries needed to notify the watchers of a restricted document
+        doesn't grow with the number of watchers.
         """
         doc = DocumentFactory()
-        thread = ThreadFactory(document=doc)
-        NewPostInLocaleEvent.notify(self.user1, locale=doc.locale)
-        NewPostInLocaleEvent.notify(self.user2, locale=doc.locale)
-
-        self.assertEqual(len(mail.outbox), 0)
-
-        post1 = PostFactory(thread=thread)
-        NewPostInLocaleEvent(post1).fire(exclude=[post1.creator])
-        self.assertEqual(len(mail.outbox), 2)
-        self.assertEqual(
-            set((mail.outbox[0].to[0], mail.outbox[1].to[0])),
-            set((self.user1.email, self.user2.email)),
-        )
-
         doc.restrict_to_groups.add(self.group)
+        thread = ThreadFactory(document=doc)
+        reply = thread.new_post(creator=self.creator, content="a post")
+        NewPostEvent.notify(self.user1, thread)
+        NewPostEvent.notify(self.user2, thread)
 
-        mail.outbox = []
-        post2 = PostFactory(thread=thread)
-        NewPostInLocaleEvent(post2).fire(exclude=[post1.creator, post2.creator])
-        self.assertEqual(len(mail.outbox), 1)
-        self.assertIn(self.user2.email, mail.outbox[0].to)
+        def fire():
+            mail.outbox.clear()
+            with CaptureQueriesContext(connection) as queries:
+                NewPostEvent(reply).fire(exclude=[self.creator])
+            return len(queries)
 
-    def test_thread_in_locale_event(self):
-        """
-        Test that NewThreadInLocaleEvent events on restricted documents will only notify
-        unrestricted users.
-        """
-        doc = DocumentFactory()
-        NewThreadInLocaleEvent.notify(self.user1, locale=doc.locale)
-        NewThreadInLocaleEvent.notify(self.user2, locale=doc.locale)
-
-        self.assertEqual(len(mail.outbox), 0)
-
-        thread1 = ThreadFactory(document=doc)
-        post1 = PostFactory(thread=thread1)
-        NewThreadInLocaleEvent(post1).fire(exclude=[post1.creator])
-        self.assertEqual(len(mail.outbox), 2)
-        self.assertEqual(
-            set((mail.outbox[0].to[0], mail.outbox[1].to[0])),
-            set((self.user1.email, self.user2.email)),
-        )
+        # Warm up the site and content-type caches before counting.
+        fire()
+        num_queries = fire()
+        self._assert_mail_to(self.user2.email)
 
-        doc.restrict_to_groups.add(self.group)
+        members = UserFactory.create_batch(3, groups=[self.group])
+        for user in members + UserFactory.create_batch(3):
+            NewPostEvent.notify(user, thread)
 
-        mail.outbox = []
-        thread2 = ThreadFactory(document=doc)
-        post2 = PostFactory(thread=thread2)
-        NewThreadInLocaleEvent(post2).fire(exclude=[post1.creator, post2.creator])
-        self.assertEqual(len(mail.outbox), 1)
-        self.assertIn(self.user2.email, mail.outbox[0].to)
+        self.assertEqual(fire(), num_queries)
+        self._assert_mail_to(self.user2.email, *(user.email for user in members))
@@ -30,45 +30,46 @@ from kitsune.wiki.tests import ApprovedRevisionFactory, DocumentFactory
 
 
 class CohortAnalysisTests(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         today = datetime.today()
-        self.start_of_first_week = today - timedelta(days=today.weekday(), weeks=12)
+        cls.start_of_first_week = today - timedelta(days=today.weekday(), weeks=12)
 
-        revisions = ApprovedRevisionFactory.create_batch(3, created=self.start_of_first_week)
+        revisions = ApprovedRevisionFactory.create_batch(3, created=cls.start_of_first_week)
 
         reviewer = UserFactory()
-        ApprovedRevisionFactory(reviewer=reviewer, created=self.start_of_first_week)
+        ApprovedRevisionFactory(reviewer=reviewer, created=cls.start_of_first_week)
 
         ApprovedRevisionFactory(
             creator=revisions[1].creator,
             reviewer=reviewer,
-            created=self.start_of_first_week + timedelta(weeks=1, days=2),
+            created=cls.start_of_first_week + timedelta(weeks=1, days=2),
         )
-        ApprovedRevisionFactory(created=self.start_of_first_week + timedelta(weeks=1, days=1))
+        ApprovedRevisionFactory(created=cls.start_of_first_week + timedelta(weeks=1, days=1))
 
         for r in revisions:
             lr = ApprovedRevisionFactory(
-                created=self.start_of_first_week + timedelta(days=1), document__locale="es"
+                created=cls.start_of_first_week + timedelta(days=1), document__locale="es"
             )
             ApprovedRevisionFactory(
-                created=self.start_of_first_week + timedelta(weeks=2, days=1),
+                created=cls.start_of_first_week + timedelta(weeks=2, days=1),
                 creator=lr.creator,
                 document__locale="es",
             )
 
         answers = AnswerFactory.create_batch(
-            7, created=self.start_of_first_week + timedelta(weeks=1, days=2)
+            7, created=cls.start_of_first_week + timedelta(weeks=1, days=2)
         )
 
         AnswerFactory(
             question=answers[2].question,
             creator=answers[2].question.creator,
-            created=self.start_of_first_week + timedelta(weeks=1, days=2),
+            created=cls.start_of_first_week + timedelta(weeks=1, days=2),
         )
 
         for a in answers[:2]:
             AnswerFactory(
-                creator=a.creator, created=self.start_of_first_week + timedelta(weeks=2, days=5)
+                creator=a.creator, created=cls.start_of_first_week + timedelta(weeks=2, days=5)
             )
 
         call_command("cohort_analysis")
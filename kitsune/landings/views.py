@@ -2,7 +2,7 @@ from django.http import Http404
 from django.shortcuts import render
 from jinja2 import TemplateNotFound
 
-from kitsune.products.models import Product
+from kitsune.products.utils import get_visible_products
 from kitsune.wiki.decorators import check_simple_wiki_locale
 from kitsune.wiki.utils import get_featured_articles
 
@@ -14,7 +14,7 @@ def home(request):
         request,
         "landings/home.html",
         {
-            "products": Product.objects.filter(visible=True),
+            "products": get_visible_products(),
             "featured": get_featured_articles(locale=request.LANGUAGE_CODE),
         },
     )
@@ -62,6 +62,17 @@ class LoggingEmailBackend(object):
         self._batch_id = None
         return ret
 
+    def __enter__(self):
+        try:
+            self.open()
+        except Exception:
+            self.close()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def send_messages(self, messages):
         """
         Sends one or more EmailMessage objects and returns the number of email messages sent.
@@ -103,6 +103,15 @@ class TestLoggingEmailBackend(TestCase):
         logging_backend = LoggingEmailBackend(fail_silently=True)
         self.assertEqual(logging_backend.real_backend.fail_silently, True)
 
+    @override_settings(
+        EMAIL_LOGGING_REAL_BACKEND="kitsune.lib.tests.test_email.SucceedingMockEmailBackend"
+    )
+    def test_context_manager(self):
+        # The connection is opened on enter and closed on exit.
+        with LoggingEmailBackend() as logging_backend:
+            self.assertEqual(logging_backend.real_backend._is_open, True)
+        self.assertEqual(logging_backend.real_backend._is_open, False)
+
     # The below tests validate several things in 3 cases. The 3 cases are:
     #
     # * The email backend always suceeds.
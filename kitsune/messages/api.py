@@ -15,38 +15,47 @@ from kitsune.users.templatetags.jinja_helpers import profile_avatar
 @json_view
 def get_autocomplete_suggestions(request):
     """An API to provide auto-complete data for user names or groups."""
-    pre = request.GET.get("term", "") or request.GET.get("query", "")
-    if not pre or not request.user.is_authenticated:
+    pre = request.GET.get("term") or request.GET.get("query")
+    if not pre:
         return []
 
-    def create_suggestion(item):
-        """Create a dictionary object for the autocomplete suggestion."""
-        is_user = isinstance(item, User)
+    user_icon = webpack_static(settings.DEFAULT_USER_ICON)
+
+    def user_suggestion(user):
+        """Create a dictionary object for a user autocomplete suggestion."""
         return {
-            "type": "User" if is_user else "Group",
-            "type_icon": webpack_static(
-                settings.DEFAULT_USER_ICON if is_user else settings.DEFAULT_GROUP_ICON
-            ),
-            "name": item.username if is_user else item.name,
-            "type_and_name": f"User: {item.username}" if is_user else f"Group: {item.name}",
-            "display_name": item.profile.name if is_user else item.name,
-            "avatar": (
-                profile_avatar(item, 24) if is_user else webpack_static(settings.DEFAULT_AVATAR)
-            ),
+            "type": "User",
+            "type_icon": user_icon,
+            "name": user.username,
+            "type_and_name": f"User: {user.username}",
+            "display_name": user.profile.name,
+            "avatar": profile_avatar(user, 24),
         }
 
-    suggestions = []
     user_criteria = Q(username__istartswith=pre) | Q(profile__name__istartswith=pre)
-    users = User.objects.filter(
-        user_criteria, is_active=True, profile__is_fxa_migrated=True
-    ).select_related("profile")[:10]
-
-    for user in users:
-        suggestions.append(create_suggestion(user))
+    users = (
+        User.objects.filter(user_criteria, is_active=True, profile__is_fxa_migrated=True)
+        .select_related("profile")
+        .only("username", "profile__name", "profile__fxa_avatar")[:10]
+    )
+    suggestions = [user_suggestion(user) for user in users]
 
     if request.user.profile.in_staff_group:
+        group_icon = webpack_static(settings.DEFAULT_GROUP_ICON)
+        group_avatar = webpack_static(settings.DEFAULT_AVATAR)
+
+        def group_suggestion(group):
+            """Create a dictionary object for a group autocomplete suggestion."""
+            return {
+                "type": "Group",
+                "type_icon": group_icon,
+                "name": group.name,
+                "type_and_name": f"Group: {group.name}",
+                "display_name": group.name,
+                "avatar": group_avatar,
+            }
+
         groups = Group.objects.filter(name__istartswith=pre, profile__isnull=False)[:10]
-        for group in groups:
-            suggestions.append(create_suggestion(group))
+        suggestions.extend(group_suggestion(group) for group in groups)
 
     return suggestions
@@ -2,6 +2,7 @@ from datetime import datetime
 
 from django.contrib.auth.models import Group, User
 from django.db import models
+from django.utils.functional import cached_property
 
 from kitsune.sumo.models import ModelBase
 
@@ -68,6 +69,29 @@ class OutboxMessage(ModelBase):
         to_group = ", ".join([g.name for g in self.to_group.all()]) or None
         return "from:%s to:%s groups:%s %s" % (self.sender, to, to_group, self.message[0:30])
 
+    # The recipients are read through all(), so they come from the prefetch cache
+    # when listing views prefetch them.
+    @cached_property
+    def recipients(self):
+        return list(self.to.all())
+
+    @cached_property
+    def to_groups(self):
+        return list(self.to_group.all())
+
+    @property
+    def recipients_count(self):
+        return len(self.recipients)
+
+    @property
+    def to_groups_count(self):
+        return len(self.to_groups)
+
+    @property
+    def recipient(self):
+        """The recipient, if the message was sent to exactly one user."""
+        return self.recipients[0] if self.recipients_count == 1 else None
+
     @property
     def content_parsed(self):
         from kitsune.sumo.templatetags.jinja_helpers import wiki_to_html
@@ -1,3 +1,6 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from kitsune.messages.models import InboxMessage, OutboxMessage
 from kitsune.sumo.tests import TestCase
 from kitsune.sumo.urlresolvers import reverse
@@ -28,6 +31,13 @@ class ReadMessageTests(TestCase):
 
         self.assertContains(resp, "No messages selected")
 
+    def test_mark_bulk_read_invalid_id(self):
+        i = InboxMessage.objects.create(sender=self.user2, to=self.user1, message="foo")
+        url = reverse("messages.bulk_action", locale="en-US")
+        resp = self.client.post(url, {"id": [i.pk, "foo"], "mark_read": True})
+        self.assertEqual(400, resp.status_code)
+        assert not InboxMessage.objects.get(pk=i.pk).read
+
     def test_mark_message_read(self):
         i = InboxMessage.objects.create(sender=self.user2, to=self.user1, message="foo")
         assert not i.read
@@ -75,6 +85,17 @@ class DeleteMessageTests(TestCase):
         self.assertEqual(200, resp.status_code)
         self.assertEqual(0, InboxMessage.objects.count())
 
+    def test_delete_message_ajax(self):
+        i = InboxMessage.objects.create(sender=self.user2, to=self.user1, message="foo")
+        resp = self.client.post(
+            reverse("messages.delete", args=[i.pk], locale="en-US"),
+            {"confirmed": True},
+            HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+        )
+        self.assertEqual(200, resp.status_code)
+        self.assertEqual({"deleted": [i.pk]}, resp.json())
+        self.assertEqual(0, InboxMessage.objects.count())
+
     def test_delete_many_message(self):
         i = InboxMessage.objects.create(to=self.user1, sender=self.user2, message="foo")
         j = InboxMessage.objects.create(to=self.user1, sender=self.user2, message="foo")
@@ -118,6 +139,21 @@ class OutboxTests(TestCase):
         resp = self.client.post(reverse("messages.outbox"), follow=True)
         self.assertEqual(200, resp.status_code)
 
+    def test_outbox_queries(self):
+        """The number of queries doesn't grow with the number of listed messages."""
+
+        def get_outbox():
+            with CaptureQueriesContext(connection) as queries:
+                resp = self.client.get(reverse("messages.outbox"), follow=True)
+            self.assertEqual(200, resp.status_code)
+            return len(queries)
+
+        OutboxMessage.objects.create(sender=self.user1, message="foo").to.add(self.user2)
+        num_queries = get_outbox()
+        for user in UserFactory.create_batch(3):
+            OutboxMessage.objects.create(sender=self.user1, message="foo").to.add(user)
+        self.assertEqual(get_outbox(), num_queries)
+
     def test_delete_many_outbox_message(self):
         i = OutboxMessage.objects.create(sender=self.user1, message="foo")
         i.to.add(self.user2)
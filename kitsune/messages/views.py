@@ -1,8 +1,8 @@
-import json
-
 from django.conf import settings
 from django.contrib import messages as contrib_messages
-from django.http import HttpResponse, HttpResponseBadRequest, HttpResponseRedirect
+from django.contrib.auth.models import User
+from django.db.models import Prefetch
+from django.http import HttpResponseBadRequest, HttpResponseRedirect, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils.translation import gettext as _
 from django.utils.translation import ngettext
@@ -16,6 +16,15 @@ from kitsune.messages.utils import send_message
 from kitsune.sumo.urlresolvers import reverse
 from kitsune.sumo.utils import is_ratelimited, paginate
 
+# Prefetched wherever outbox messages are shown with their recipients. Only the
+# columns needed to link to a recipient's profile are loaded.
+OUTBOX_RECIPIENTS = (
+    Prefetch(
+        "to", queryset=User.objects.select_related("profile").only("username", "profile__name")
+    ),
+    "to_group__profile",
+)
+
 
 @login_required
 def inbox(request):
@@ -54,16 +63,10 @@ def read(request, msgid):
 
 @login_required
 def read_outbox(request, msgid):
-    message = get_object_or_404(OutboxMessage, pk=msgid, sender=request.user)
-    return render(
-        request,
-        "messages/read-outbox.html",
-        {
-            "message": _add_recipients(message),
-            "to_users": message.to.all(),
-            "to_groups": message.to_group.all(),
-        },
+    message = get_object_or_404(
+        OutboxMessage.objects.prefetch_related(*OUTBOX_RECIPIENTS), pk=msgid, sender=request.user
     )
+    return render(request, "messages/read-outbox.html", {"message": message})
 
 
 @login_required
@@ -72,14 +75,11 @@ def outbox(request):
     messages = (
         OutboxMessage.objects.filter(sender=user)
         .order_by("-created")
-        .prefetch_related("to", "to_group")
+        .prefetch_related(*OUTBOX_RECIPIENTS)
     )
     count = messages.count()
     messages = paginate(request, messages, per_page=MESSAGES_PER_PAGE, count=count)
 
-    for msg in messages.object_list:
-        _add_recipients(msg)
-
     return render(request, "messages/outbox.html", {"msgs": messages})
 
 
@@ -112,7 +112,10 @@ def new_message(request):
 @login_required
 def bulk_action(request, msgtype="inbox"):
     """Apply action to selected messages."""
-    msgids = request.POST.getlist("id")
+    try:
+        msgids = [int(m) for m in request.POST.getlist("id")]
+    except ValueError:
+        return HttpResponseBadRequest()
 
     if len(msgids) == 0:
         contrib_messages.add_message(
@@ -134,7 +137,7 @@ def bulk_action(request, msgtype="inbox"):
 @login_required
 def delete(request, msgid=None, msgtype="inbox"):
     if msgid:
-        msgids = [msgid]
+        msgids = [int(msgid)]
     else:
         try:
             msgids = [int(m) for m in request.POST.getlist("id")]
@@ -147,7 +150,9 @@ def delete(request, msgid=None, msgtype="inbox"):
         messages = OutboxMessage.objects.filter(pk__in=msgids, sender=request.user)
 
     if request.method == "POST" and "confirmed" in request.POST:
-        if messages.count() != len(msgids):
+        deleted_ids = set(messages.values_list("pk", flat=True))
+        if deleted_ids != set(msgids):
+            deleted_ids = set()
             contrib_messages.add_message(
                 request, contrib_messages.ERROR, _("Messages didn't add up. Try again.")
             )
@@ -157,13 +162,12 @@ def delete(request, msgid=None, msgtype="inbox"):
             contrib_messages.add_message(request, contrib_messages.SUCCESS, msg)
 
         if request.headers.get("x-requested-with") == "XMLHttpRequest":
-            return HttpResponse(json.dumps({"message": m} for m in messages))
+            return JsonResponse({"deleted": sorted(deleted_ids)})
 
         return HttpResponseRedirect(reverse("messages.{t}".format(t=msgtype)))
 
-    if msgtype == "outbox":
-        for message in messages:
-            _add_recipients(message)
+    if msgtype != "inbox":
+        messages = messages.prefetch_related(*OUTBOX_RECIPIENTS)
 
     return render(
         request, "messages/delete.html", {"msgs": messages, "msgid": msgid, "msgtype": msgtype}
@@ -176,17 +180,3 @@ def preview_async(request):
     """Ajax preview of posts."""
     m = OutboxMessage(sender=request.user, message=request.POST.get("content", ""))
     return render(request, "messages/includes/message_preview.html", {"message": m})
-
-
-def _add_recipients(msg):
-    # Set the counts based on the lists
-    msg.recipients_count = msg.to.all().count()
-    msg.to_groups_count = msg.to_group.all().count()
-
-    # Assign the recipient based on the number of recipients
-    msg.recipient = msg.to.all()[0] if msg.recipients_count == 1 else None
-
-    # Assign the group(s) based on the number of groups
-    msg.to_groups = list(msg.to_group.prefetch_related("profile"))
-
-    return msg
@@ -7,6 +7,7 @@ class SignatureAdmin(admin.ModelAdmin):
     list_display = ["__str__", "signature", "document"]
     list_editable = ["signature", "document"]
     raw_id_fields = ["document"]
+    list_select_related = ["document"]
 
 
 admin.site.register(Signature, SignatureAdmin)
@@ -12,6 +12,6 @@ class Signature(ModelBase):
         return "<%s> %s" % (self.signature, self.document.title)
 
     def get_absolute_url(self):
-        doc = self.document.get_absolute_url().lstrip("/")
-        _, _, url = doc.partition("/")
-        return "/" + url
+        # Drop the leading locale segment from the document's URL.
+        url = self.document.get_absolute_url()
+        return url[url.index("/", 1) :]
@@ -13,7 +13,7 @@ def api(request):
 
     # Don't use get_object_or_404 so we can return a 404 with no content.
     try:
-        sig = Signature.objects.get(signature=s)
+        sig = Signature.objects.select_related("document").get(signature=s)
     except Signature.DoesNotExist:
         return HttpResponse("", status=404, content_type="text/plain")
 
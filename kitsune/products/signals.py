@@ -1,7 +1,9 @@
-from django.db.models.signals import pre_save
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from kitsune.products.models import Topic, TopicSlugHistory
+from kitsune.products.models import Product, Topic, TopicSlugHistory
+from kitsune.products.utils import VISIBLE_PRODUCTS_CACHE_KEY
 
 
 @receiver(pre_save, sender=Topic)
@@ -16,3 +18,9 @@ def update_topic_slug_history(sender, instance, **kwargs):
                 old_topic.save()
             except TopicSlugHistory.DoesNotExist:
                 TopicSlugHistory.objects.create(topic=instance, slug=old_instance.slug)
+
+
+@receiver(post_save, sender=Product, dispatch_uid="products.signals.clear_visible_products")
+@receiver(post_delete, sender=Product, dispatch_uid="products.signals.clear_visible_products")
+def clear_visible_products(sender, instance, **kwargs):
+    cache.delete(VISIBLE_PRODUCTS_CACHE_KEY)
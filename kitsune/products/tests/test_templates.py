@@ -81,6 +81,22 @@ class ProductViewsTestCase(Elastic7TestCase):
         self.assertEqual(3, len(doc("#document-list > section > article")))
         self.assertEqual(p.slug, doc("#support-search input[name=product]").attr["value"])
 
+    def test_document_listing_first_revision(self):
+        """Verify documents with a single approved revision are shown as created."""
+        p = ProductFactory()
+        t = TopicFactory(product=p)
+        doc = ApprovedRevisionFactory(document__products=[p], document__topics=[t]).document
+        ApprovedRevisionFactory(document=doc)
+        ApprovedRevisionFactory(document__products=[p], document__topics=[t])
+
+        url = reverse("products.documents", args=[p.slug, t.slug])
+        r = self.client.get(url, follow=True)
+        self.assertEqual(200, r.status_code)
+        labels = sorted(
+            pq(el).text() for el in pq(r.content)("#document-list .last-updated strong")
+        )
+        self.assertEqual(["Created:", "Last updated:"], labels)
+
     def test_document_listing_order(self):
         """Verify documents are sorted by display_order and number of helpful votes."""
         # Create topic, product and documents.
@@ -0,0 +1,27 @@
+from kitsune.products.tests import ProductFactory
+from kitsune.products.utils import get_visible_products
+from kitsune.sumo.tests import TestCase
+
+
+class GetVisibleProductsTests(TestCase):
+    def test_visible_only(self):
+        p = ProductFactory(visible=True)
+        ProductFactory(visible=False)
+        self.assertEqual(get_visible_products(), [p])
+
+    def test_cached(self):
+        ProductFactory(visible=True)
+        get_visible_products()
+        with self.assertNumQueries(0):
+            get_visible_products()
+
+    def test_cache_cleared_on_change(self):
+        p1 = ProductFactory(visible=True)
+        self.assertEqual(get_visible_products(), [p1])
+        p2 = ProductFactory(visible=True, display_order=p1.display_order + 1)
+        self.assertEqual(get_visible_products(), [p1, p2])
+        p1.visible = False
+        p1.save()
+        self.assertEqual(get_visible_products(), [p2])
+        p2.delete()
+        self.assertEqual(get_visible_products(), [])
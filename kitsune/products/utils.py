@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from kitsune.products.models import Product
+
+VISIBLE_PRODUCTS_CACHE_KEY = "products:visible"
+
+
+def get_visible_products():
+    """
+    Returns a list of the visible products, cached since it's needed on every
+    home page view and rarely changes. The cache is cleared whenever a product
+    is saved or deleted.
+    """
+    return cache.get_or_set(
+        VISIBLE_PRODUCTS_CACHE_KEY,
+        lambda: list(Product.objects.filter(visible=True)),
+        settings.CACHE_SHORT_TIMEOUT,
+    )
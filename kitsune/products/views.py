@@ -1,12 +1,13 @@
 import json
 from datetime import datetime, timedelta
 
-from django.db.models import OuterRef, Subquery
+from django.db.models import Count, OuterRef, Subquery
 from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from product_details import product_details
 
 from kitsune.products.models import Product, Topic, TopicSlugHistory
+from kitsune.products.utils import get_visible_products
 from kitsune.questions import config as aaq_config
 from kitsune.sumo import NAVIGATION_TOPICS
 from kitsune.wiki.decorators import check_simple_wiki_locale
@@ -19,17 +20,20 @@ from kitsune.wiki.utils import get_featured_articles
 def product_list(request):
     """The product picker page."""
     template = "products/products.html"
-    products = Product.objects.filter(visible=True)
-    return render(request, template, {"products": products})
+    return render(request, template, {"products": get_visible_products()})
+
+
+# Maps product slugs to their AAQ product keys. The AAQ config is static, so
+# the mapping is built once at import time.
+AAQ_PRODUCT_KEYS = {
+    v["product"]: k
+    for k, v in aaq_config.products.items()
+    if isinstance(v, dict) and v.get("product")
+}
 
 
 def _get_aaq_product_key(slug):
-    product_key = ""
-    for k, v in aaq_config.products.items():
-        if isinstance(v, dict):
-            if v.get("product") == slug:
-                product_key = k
-    return product_key or None
+    return AAQ_PRODUCT_KEYS.get(slug)
 
 
 @check_simple_wiki_locale
@@ -150,12 +154,19 @@ def document_listing(request, topic_slug, product_slug=None, subtopic_slug=None)
 
     documents, fallback_documents = documents_for(request.user, **doc_kw)
 
+    # Find the listed documents with a single approved revision in one query.
+    first_revision_doc_ids = set(
+        Revision.objects.filter(document__in=[d["id"] for d in documents], is_approved=True)
+        .values("document")
+        .annotate(num_approved=Count("id"))
+        .filter(num_approved=1)
+        .values_list("document", flat=True)
+    )
+
     thirty_days_ago = datetime.now() - timedelta(days=30)
     for document in documents:
         document["is_past_thirty_days"] = document["created"] < thirty_days_ago
-        document["is_first_revision"] = (
-            Revision.objects.filter(document=document["id"], is_approved=True).count() == 1
-        )
+        document["is_first_revision"] = document["id"] in first_revision_doc_ids
 
     return render(
         request,
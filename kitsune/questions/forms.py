@@ -79,10 +79,7 @@ class EditQuestionForm(forms.ModelForm):
         super(EditQuestionForm, self).__init__(*args, **kwargs)
 
         #  Extra fields required by product/category selected
-        extra_fields = []
-
-        if product:
-            extra_fields += product.get("extra_fields", [])
+        extra_fields = set(product.get("extra_fields", [])) if product else set()
 
         if "sites_affected" in extra_fields:
             field = forms.CharField(
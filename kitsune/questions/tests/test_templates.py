@@ -1092,9 +1092,7 @@ class QuestionsTemplateTestCase(TestCase):
 
         q1 = QuestionFactory()
         q2 = QuestionFactory(product=p1)
-        q2.save()
         q3 = QuestionFactory(product=p2)
-        q3.save()
 
         def check(product, expected):
             url = reverse("questions.list", args=[product])
@@ -12,7 +12,7 @@ from kitsune.questions.tests import AnswerFactory, QuestionFactory
 from kitsune.questions.views import parse_troubleshooting
 from kitsune.search.tests import Elastic7TestCase
 from kitsune.sumo.templatetags.jinja_helpers import urlparams
-from kitsune.sumo.tests import TestCase, eq_msg, get, template_used
+from kitsune.sumo.tests import TestCase, get, template_used
 from kitsune.sumo.urlresolvers import reverse
 from kitsune.tidings.models import Watch
 from kitsune.users.tests import UserFactory, add_permission
@@ -271,7 +271,7 @@ class TestQuestionList(TestCase):
             url = urlparams(reverse("questions.list", args=["all"], locale=locale))
             response = self.client.get(url, follow=True)
             doc = pq(response.content)
-            eq_msg(
+            self.assertEqual(
                 len(doc("article[id^=question]")),
                 len(titles),
                 "Wrong number of results for {0}".format(locale),
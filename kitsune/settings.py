@@ -513,6 +513,7 @@ MIDDLEWARE: tuple[str, ...] = (
     "kitsune.sumo.middleware.InAAQMiddleware",
     "kitsune.users.middleware.LogoutDeactivatedUsersMiddleware",
     "kitsune.users.middleware.LogoutInvalidatedSessionsMiddleware",
+    "kitsune.users.middleware.PrefetchUserGroupsMiddleware",
     "csp.middleware.CSPMiddleware",
     "dockerflow.django.middleware.DockerflowMiddleware",
     "wagtail.contrib.redirects.middleware.RedirectMiddleware",
@@ -19,11 +19,8 @@ def send_messages(messages):
     if not messages:
         return
 
-    conn = mail.get_connection(fail_silently=True)
-    conn.open()
-
-    for msg in messages:
-        conn.send_messages([msg])
+    with mail.get_connection(fail_silently=True) as conn:
+        conn.send_messages(messages)
 
 
 def safe_translation(f):
@@ -18,8 +18,9 @@ class Paginator(DjPaginator):
         super(Paginator, self).__init__(
             object_list, per_page, orphans=orphans, allow_empty_first_page=allow_empty_first_page
         )
-        if count:
-            self._count = count
+        if count is not None:
+            # Django's "count" is a cached property, so this skips the COUNT query.
+            self.count = count
 
 
 class SimplePaginator(DjPaginator):
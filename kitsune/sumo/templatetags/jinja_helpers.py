@@ -348,6 +348,34 @@ def number(context, n):
     return format_decimal(n, locale=_babel_locale(_contextual_locale(context)))
 
 
+# Units used by timesince, from largest to smallest. The names are looked up
+# when called so they are translated to the active language.
+TIMESINCE_CHUNKS = (
+    (
+        60 * 60 * 24 * 365,
+        lambda n: ngettext("%(number)d year ago", "%(number)d years ago", n),
+    ),
+    (
+        60 * 60 * 24 * 30,
+        lambda n: ngettext("%(number)d month ago", "%(number)d months ago", n),
+    ),
+    (
+        60 * 60 * 24 * 7,
+        lambda n: ngettext("%(number)d week ago", "%(number)d weeks ago", n),
+    ),
+    (
+        60 * 60 * 24,
+        lambda n: ngettext("%(number)d day ago", "%(number)d days ago", n),
+    ),
+    (
+        60 * 60,
+        lambda n: ngettext("%(number)d hour ago", "%(number)d hours ago", n),
+    ),
+    (60, lambda n: ngettext("%(number)d minute ago", "%(number)d minutes ago", n)),
+    (1, lambda n: ngettext("%(number)d second ago", "%(number)d seconds ago", n)),
+)
+
+
 @library.filter
 def timesince(d, now=None):
     """Take two datetime objects and return the time between d and now as a
@@ -366,30 +394,6 @@ def timesince(d, now=None):
     """
     if d is None:
         return ""
-    chunks = [
-        (
-            60 * 60 * 24 * 365,
-            lambda n: ngettext("%(number)d year ago", "%(number)d years ago", n),
-        ),
-        (
-            60 * 60 * 24 * 30,
-            lambda n: ngettext("%(number)d month ago", "%(number)d months ago", n),
-        ),
-        (
-            60 * 60 * 24 * 7,
-            lambda n: ngettext("%(number)d week ago", "%(number)d weeks ago", n),
-        ),
-        (
-            60 * 60 * 24,
-            lambda n: ngettext("%(number)d day ago", "%(number)d days ago", n),
-        ),
-        (
-            60 * 60,
-            lambda n: ngettext("%(number)d hour ago", "%(number)d hours ago", n),
-        ),
-        (60, lambda n: ngettext("%(number)d minute ago", "%(number)d minutes ago", n)),
-        (1, lambda n: ngettext("%(number)d second ago", "%(number)d seconds ago", n)),
-    ]
     if not now:
         if is_aware(d):
             now = datetime.datetime.now(get_default_timezone())
@@ -402,7 +406,7 @@ def timesince(d, now=None):
     if since <= 0:
         # d is in the future compared to now, stop processing.
         return ""
-    for i, (seconds, name) in enumerate(chunks):
+    for i, (seconds, name) in enumerate(TIMESINCE_CHUNKS):
         count = since // seconds
         if count != 0:
             break
@@ -72,11 +72,6 @@ def emailmessage_raise_smtp():
     raise SMTPRecipientsRefused(recipients=[])
 
 
-def eq_msg(a, b, msg=None):
-    """Shorthand for 'assert a == b, "%s %r != %r" % (msg, a, b)'"""
-    assert a == b, (str(msg) or "") + " (%r != %r)" % (a, b)
-
-
 class FuzzyUnicode(factory.fuzzy.FuzzyText):
     """A FuzzyText factory that contains at least one non-ASCII character."""
 
@@ -27,6 +27,14 @@ def test_invalid_page_param():
     TestCase().assertEqual(paginated.url, request.build_absolute_uri(request.path) + "?")
 
 
+def test_paginate_with_count():
+    """A count that's passed in is used instead of counting the objects."""
+    request = RequestFactory().get(reverse("search"))
+    paginated = paginate(request, list(range(10)), per_page=2, count=100)
+    TestCase().assertEqual(100, paginated.paginator.count)
+    TestCase().assertEqual(50, paginated.paginator.num_pages)
+
+
 def test_paginator_filter():
     tc = TestCase()
     # Correct number of <li>s on page 1.
@@ -59,7 +59,6 @@ class GetObjectFallbackTests(TestCase):
     def test_from_french(self):
         # Create the English document
         d = DocumentFactory(title="A doc")
-        d.save()
         # Returns English document for French
         obj = get_object_fallback(Document, "A doc", "fr", "!")
         self.assertEqual(d, obj)
@@ -1,6 +1,7 @@
 import json
 import re
 import sys
+import time
 from datetime import datetime
 from functools import lru_cache
 from urllib.parse import urlparse
@@ -8,6 +9,7 @@ from urllib.parse import urlparse
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.sites.models import Site
+from django.core.cache import cache
 from django.db import models
 from django.db.models.signals import pre_delete
 from django.templatetags.static import static
@@ -15,6 +17,7 @@ from django.utils.encoding import iri_to_uri
 from django.utils.http import url_has_allowed_host_and_scheme, urlencode
 from django_ratelimit.core import is_ratelimited as is_ratelimited_core
 
+from kitsune.access.utils import in_group
 from kitsune.journal.models import Record
 from kitsune.lib.tlds import VALID_TLDS
 from kitsune.sumo import paginator
@@ -365,7 +368,7 @@ def is_trusted_user(user: User | None) -> bool:
         and (
             user.is_superuser
             or user.profile.in_staff_group
-            or user.groups.filter(name__in=settings.TRUSTED_GROUPS).exists()
+            or in_group(user, *settings.TRUSTED_GROUPS)
         )
     )
 
@@ -373,3 +376,22 @@ def is_trusted_user(user: User | None) -> bool:
 def in_staff_group(user: User | None) -> bool:
     """Check if a user is in the Staff group."""
     return bool(user and user.is_authenticated and user.profile.in_staff_group)
+
+
+def get_cache_generation(key):
+    """
+    Returns the generation stored under the given cache key. It's meant to be
+    part of other cache keys, so that bumping it invalidates all of them at once.
+
+    A missing generation is seeded with a timestamp rather than a fixed value, so
+    an evicted generation never comes back as one that cached keys still use.
+    """
+    return cache.get_or_set(key, time.time_ns, None)
+
+
+def bump_cache_generation(key):
+    """Moves the generation stored under the given cache key forward."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
@@ -135,11 +135,13 @@ class Event(object):
           passed in, each of those users will not be notified, though anonymous
           notifications having the same email address may still be sent.
         """
-        connection = mail.get_connection(fail_silently=True)
+        # Send every mail over a single connection, which is closed when done.
+        # The mails are still built lazily, one recipient at a time, so large
+        # watcher lists aren't held in memory.
         # Warning: fail_silently swallows errors thrown by the generators, too.
-        connection.open()
-        for m in self._mails(self._users_watching(exclude=exclude)):
-            connection.send_messages([m])
+        with mail.get_connection(fail_silently=True) as connection:
+            for m in self._mails(self._users_watching(exclude=exclude)):
+                connection.send_messages([m])
 
     def serialize(self):
         """
@@ -13,6 +13,7 @@ from django.views.decorators.clickjacking import xframe_options_sameorigin
 from django.views.decorators.http import require_POST
 
 from kitsune.access.decorators import login_required
+from kitsune.access.utils import in_group
 from kitsune.upload.models import ImageAttachment
 from kitsune.upload.utils import FileTooLargeError, upload_imageattachment
 
@@ -42,13 +43,12 @@ def up_image_async(request, model_name, object_pk):
         return HttpResponseNotFound(json.dumps({"status": "error", "message": message}))
 
     # Reject the request if you're not a superuser, the owner of the object
-    # or a member of the trusted contributors group
-    if not any(
-        [
-            user.is_superuser,
-            user == getattr(obj, "creator", obj),
-            user.groups.filter(name="trusted contributors").exists(),
-        ]
+    # or a member of the trusted contributors group. The checks are ordered
+    # so that the group lookup only happens when the cheaper ones fail.
+    if not (
+        user.is_superuser
+        or user == getattr(obj, "creator", obj)
+        or in_group(user, "trusted contributors")
     ):
         message = _("You cannot associate an image with an object you do not own.")
         return HttpResponseBadRequest(json.dumps({"status": "error", "message": message}))
@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from django.contrib.auth import logout
+from django.db.models import prefetch_related_objects
 from django.http import HttpResponseRedirect
 from django.utils.deprecation import MiddlewareMixin
 
@@ -38,3 +39,17 @@ class LogoutInvalidatedSessionsMiddleware(MiddlewareMixin):
                     return HttpResponseRedirect(reverse("home"))
             else:
                 request.session["first_seen"] = datetime.utcnow()
+
+
+class PrefetchUserGroupsMiddleware(MiddlewareMixin):
+    """Prefetches the groups of the logged in user.
+
+    Group checks made while handling the request (see kitsune.access.utils)
+    then read the prefetched groups instead of querying the database.
+    """
+
+    def process_request(self, request):
+        user = request.user
+
+        if user.is_authenticated:
+            prefetch_related_objects([user], "groups")
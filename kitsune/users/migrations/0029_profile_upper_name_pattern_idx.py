@@ -0,0 +1,36 @@
+# Generated by Django 4.2.11 on 2026-10-15 11:02
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0028_alter_profile_bio_and_upper_name_idx"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="profile",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="text_pattern_ops"
+                ),
+                name="upper_name_pattern_idx",
+            ),
+        ),
+        # The username prefix search runs against auth_user, which isn't ours to
+        # declare indexes on, so it's created directly.
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS auth_user_upper_username_pattern_idx "
+                "ON auth_user (UPPER(username) text_pattern_ops)"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS auth_user_upper_username_pattern_idx",
+        ),
+    ]
@@ -5,11 +5,13 @@ from functools import cached_property
 
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
 from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _lazy
 from timezone_field import TimeZoneField
 
+from kitsune.access.utils import in_group
 from kitsune.lib.countries import COUNTRIES
 from kitsune.products.models import Product
 from kitsune.sumo.models import LocaleField, ModelBase
@@ -132,7 +134,13 @@ class Profile(ModelBase):
     updated_column_name = "user__date_joined"
 
     class Meta(object):
-        indexes = [models.Index(Upper("name"), name="upper_name_idx")]
+        indexes = [
+            models.Index(Upper("name"), name="upper_name_idx"),
+            # Supports the case-insensitive prefix searches of the autocomplete APIs.
+            models.Index(
+                OpClass(Upper("name"), name="text_pattern_ops"), name="upper_name_pattern_idx"
+            ),
+        ]
         permissions = (
             ("view_karma_points", "Can view karma points"),
             ("deactivate_users", "Can deactivate users"),
@@ -230,7 +238,7 @@ class Profile(ModelBase):
 
     @cached_property
     def in_staff_group(self):
-        return self.user.groups.filter(name=settings.STAFF_GROUP).exists()
+        return in_group(self.user, settings.STAFF_GROUP)
 
 
 class Setting(ModelBase):
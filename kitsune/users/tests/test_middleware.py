@@ -6,9 +6,13 @@ from django.contrib.auth.middleware import AuthenticationMiddleware
 from django.contrib.auth.models import AnonymousUser
 from django.http import HttpResponseRedirect, HttpResponse
 
-from kitsune.users.middleware import LogoutInvalidatedSessionsMiddleware
+from kitsune.access.utils import get_group_ids, get_group_names
+from kitsune.users.middleware import (
+    LogoutInvalidatedSessionsMiddleware,
+    PrefetchUserGroupsMiddleware,
+)
 from kitsune.sumo.tests import TestCase
-from kitsune.users.tests import UserFactory, ProfileFactory
+from kitsune.users.tests import GroupFactory, UserFactory, ProfileFactory
 
 
 class LogoutInvalidatedSessionsMiddlewareTests(TestCase):
@@ -73,3 +77,25 @@ class LogoutInvalidatedSessionsMiddlewareTests(TestCase):
         self._process_request(self.request)
 
         self.assertEqual(user, self.request.user)
+
+
+class PrefetchUserGroupsMiddlewareTests(TestCase):
+    def setUp(self):
+        self.request = RequestFactory().request()
+        self.middleware = PrefetchUserGroupsMiddleware(lambda *args, **kwargs: HttpResponse())
+
+    def test_anonymous_user(self):
+        self.request.user = AnonymousUser()
+        with self.assertNumQueries(0):
+            self.middleware.process_request(self.request)
+
+    def test_group_checks_use_prefetched_groups(self):
+        group = GroupFactory(name="prefetched")
+        self.request.user = UserFactory(groups=[group])
+
+        with self.assertNumQueries(1):
+            self.middleware.process_request(self.request)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(frozenset(["prefetched"]), get_group_names(self.request.user))
+            self.assertEqual([group.id], get_group_ids(self.request.user))
@@ -8,6 +8,7 @@ from django.contrib.auth.models import Group, User
 from django.contrib.auth.validators import UnicodeUsernameValidator
 from django.utils.translation import gettext as _
 
+from kitsune.access.utils import in_group
 from kitsune.messages.models import InboxMessage, OutboxMessage
 from kitsune.sumo import email_utils
 from kitsune.tidings.models import Watch
@@ -155,7 +156,4 @@ def get_oidc_fxa_setting(attr):
 
 def user_is_contributor(user):
     """Return whether the user is a contributor."""
-    return (
-        user.is_authenticated
-        and user.groups.filter(name__in=ContributionAreas.get_groups()).exists()
-    )
+    return user.is_authenticated and in_group(user, *ContributionAreas.get_groups())
@@ -6,6 +6,7 @@ class WikiConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
 
     def ready(self):
+        from kitsune.wiki import signals  # noqa
         from kitsune.wiki.badges import register_signals
 
         # register signals for badges
@@ -0,0 +1,16 @@
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
+
+from kitsune.wiki.models import Document
+from kitsune.wiki.utils import invalidate_featured_articles
+
+
+@receiver(post_save, sender=Document, dispatch_uid="wiki.signals.invalidate_featured_save")
+@receiver(
+    m2m_changed,
+    sender=Document.restrict_to_groups.through,
+    dispatch_uid="wiki.signals.invalidate_featured_restrict",
+)
+def invalidate_featured(sender, action=None, **kwargs):
+    if action in (None, "post_add", "post_remove", "post_clear"):
+        invalidate_featured_articles()
@@ -4,11 +4,18 @@ from unittest import mock
 from django.test.utils import override_settings
 from requests.exceptions import HTTPError
 
+from kitsune.dashboards import LAST_7_DAYS
+from kitsune.dashboards.models import WikiDocumentVisits
 from kitsune.products.tests import ProductFactory
 from kitsune.sumo.tests import TestCase
-from kitsune.users.tests import UserFactory
-from kitsune.wiki.tests import DocumentFactory, RevisionFactory
-from kitsune.wiki.utils import active_contributors, generate_short_url, num_active_contributors
+from kitsune.users.tests import GroupFactory, UserFactory
+from kitsune.wiki.tests import ApprovedRevisionFactory, DocumentFactory, RevisionFactory
+from kitsune.wiki.utils import (
+    active_contributors,
+    generate_short_url,
+    get_featured_articles,
+    num_active_contributors,
+)
 
 
 class ActiveContributorsTestCase(TestCase):
@@ -101,3 +108,32 @@ class GenerateShortUrlTestCase(TestCase):
         mock_response.raise_for_status.side_effect = HTTPError()
         mock_requests.return_value = mock_response
         self.assertRaises(HTTPError, generate_short_url, self.test_url)
+
+
+class GetFeaturedArticlesTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.docs = []
+        for i in range(6):
+            doc = ApprovedRevisionFactory(document__locale="en-US").document
+            WikiDocumentVisits.objects.create(document=doc, visits=100 + i, period=LAST_7_DAYS)
+            self.docs.append(doc)
+
+    def test_featured_articles(self):
+        featured = get_featured_articles()
+        self.assertEqual(4, len(featured))
+        assert set(featured) <= set(self.docs)
+
+    def test_featured_articles_cached(self):
+        get_featured_articles()
+        with self.assertNumQueries(0):
+            featured = get_featured_articles()
+        self.assertEqual(4, len(featured))
+
+    def test_featured_articles_invalidated(self):
+        """Restricting or archiving a cached candidate removes it from the results."""
+        get_featured_articles()
+        self.docs[0].restrict_to_groups.add(GroupFactory())
+        self.docs[1].is_archived = True
+        self.docs[1].save()
+        self.assertEqual(set(self.docs[2:]), set(get_featured_articles()))
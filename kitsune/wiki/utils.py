@@ -3,6 +3,7 @@ import random
 import requests
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.db.models import Prefetch, Q
 from django.db.models.functions import Now
 from django.http import Http404
@@ -10,8 +11,12 @@ from django.shortcuts import get_object_or_404
 
 from kitsune.dashboards import LAST_7_DAYS
 from kitsune.dashboards.models import WikiDocumentVisits
+from kitsune.sumo.utils import bump_cache_generation, get_cache_generation
 from kitsune.wiki.models import Document, Revision
 
+FEATURED_ARTICLES_CACHE_TIMEOUT = 60 * 5  # 5 minutes
+FEATURED_ARTICLES_GENERATION_KEY = "featured_articles:generation"
+
 
 def active_contributors(from_date, to_date=None, locale=None, product=None):
     """Return active KB contributors for the specified parameters.
@@ -108,6 +113,25 @@ def get_featured_articles(product=None, locale=settings.WIKI_DEFAULT_LANGUAGE):
 
     If a product is passed, it returns 4 random highly visited articles.
     """
+    generation = get_cache_generation(FEATURED_ARTICLES_GENERATION_KEY)
+    documents = cache.get_or_set(
+        f"featured_articles:{generation}:{product.id if product else 0}:{locale}",
+        lambda: _featured_article_candidates(product, locale),
+        FEATURED_ARTICLES_CACHE_TIMEOUT,
+    )
+
+    if len(documents) <= 4:
+        return documents
+    return random.sample(documents, 4)
+
+
+def invalidate_featured_articles():
+    """Drops the cached featured article candidates for every product and locale."""
+    bump_cache_generation(FEATURED_ARTICLES_GENERATION_KEY)
+
+
+def _featured_article_candidates(product, locale):
+    """Returns the list of most visited articles to pick featured articles from."""
     visits = (
         WikiDocumentVisits.objects.filter(period=LAST_7_DAYS)
         .filter(
@@ -117,38 +141,34 @@ def get_featured_articles(product=None, locale=settings.WIKI_DEFAULT_LANGUAGE):
         .exclude(document__products__slug__in=settings.EXCLUDE_PRODUCT_SLUGS_FEATURED_ARTICLES)
         .exclude(document__is_archived=True)
         .order_by("-visits")
-        .select_related("document")
+        .select_related("document__current_revision")
     )
 
     if product:
         visits = visits.filter(document__products__in=[product.id])
 
     visits = visits[:10]
-    documents = []
 
     if locale == settings.WIKI_DEFAULT_LANGUAGE:
-        for visit in visits:
-            documents.append(visit.document)
-    else:
-        # prefretch localised documents to avoid n+1 problem
-        visits = visits.prefetch_related(
-            Prefetch(
-                "document__translations",
-                queryset=Document.objects.visible(
-                    locale=locale, current_revision__is_approved=True, is_archived=False
-                ),
-            )
+        return [visit.document for visit in visits]
+
+    # prefretch localised documents to avoid n+1 problem
+    visits = visits.prefetch_related(
+        Prefetch(
+            "document__translations",
+            queryset=Document.objects.visible(
+                locale=locale, current_revision__is_approved=True, is_archived=False
+            ).select_related("current_revision"),
         )
+    )
 
-        for visit in visits:
-            translation = visit.document.translations.first()
-            if not translation:
-                continue
-            documents.append(translation)
-
-    if len(documents) <= 4:
-        return documents
-    return random.sample(documents, 4)
+    documents = []
+    for visit in visits:
+        translation = visit.document.translations.first()
+        if not translation:
+            continue
+        documents.append(translation)
+    return documents
 
 
 def get_visible_document_or_404(